@@ -1,5 +1,6 @@
 import tkinter as tk
 from typing import Tuple
+import numpy as np
 from nurbs_curve import NurbsCurve
 
 
@@ -12,6 +13,15 @@ class Display:
         self.current_CP = None
         self.current_CP_i = None
         self.CP_list = []          # (x, y, char, w=1.0)
+        self._next_label_ord = ord("A")
+        self._cp_xy = np.empty((0, 2))  # (x, y) of CP_list for vectorized lookups
+        self._nurbs = None         # NurbsCurve, updated in place
+        self._redraw_pending = False
+        # canvas item ids, reused via canvas.coords while dragging
+        self._cp_oval_ids = []
+        self._cp_text_ids = []
+        self._cp_line_ids = []     # [i]: line btw CP i and CP i+1
+        self._curve_line_id = None
         # self.knot_list = []
 
         self._setup()
@@ -42,7 +52,10 @@ class Display:
         self.weight_var.set(1.0)
 
         self.weight_slider = tk.Scale(self.weight_slider_frame, from_=0.1, to=10.0, resolution=0.1,
-                                      orient=tk.HORIZONTAL, label="w", command=self.update_weight_from_slider)
+                                      orient=tk.HORIZONTAL, label="w")
+        # re-evaluate once the slider is let go, not on every 0.1 step while dragging it
+        self.weight_slider.bind("<ButtonRelease-1>", self.update_weight_from_slider)
+        self.weight_slider.bind("<KeyRelease>", self.update_weight_from_slider)
         self.weight_slider.grid(row=0, column=0, padx=250)
         self.weight_slider_frame.pack(side=tk.BOTTOM, pady=10)
         self.weight_slider_frame.pack_forget()
@@ -71,9 +84,14 @@ class Display:
             # self.show_knot_modifier()
         else:
             # new point
-            self.CP_list.append((event.x, event.y, self.get_next_label(), 1.0))
+            label = chr(self._next_label_ord)
+            self._next_label_ord += 1
+            self.CP_list.append((event.x, event.y, label, 1.0))
+            self._cp_xy = np.vstack((self._cp_xy, (event.x, event.y)))
             # self.knot_list.append(0.0)
-            self.redraw_display()
+            self.draw_CP(len(self.CP_list) - 1)
+            self.redraw_NURBS_curve()
+            self.canvas.tag_raise("nurbs")
 
     def left_mouse_drag(self, event) -> None:
         """
@@ -83,7 +101,8 @@ class Display:
         if self.current_CP:
             _, _, char, w = self.CP_list[self.current_CP_i]
             self.CP_list[self.current_CP_i] = (event.x, event.y, char, w)
-            self.redraw_display()
+            self._cp_xy[self.current_CP_i] = (event.x, event.y)
+            self._schedule_redraw()
 
     def left_mouse_release(self, event) -> None:
         """
@@ -100,66 +119,124 @@ class Display:
         :param radius: int of radius to search
         :return: x: int, y: int tuple of coordinates for nearest CP or None
         """
-        # closest CP in radius
-        for i, (px, py, char, w) in enumerate(self.CP_list):
-            if (x - px) ** 2 + (y - py) ** 2 <= radius ** 2:
-                self.current_CP_i = i
-                return px, py
-        return None
-
-    def get_next_label(self) -> chr:
-        """
-        :return: chr of Label for next Control Point
-        """
         if not self.CP_list:
-            return "A"
+            return None
 
-        return chr(ord(max(self.CP_list, key=lambda P: P[2])[2]) + 1)
+        # closest CP in radius
+        d2 = ((self._cp_xy - (x, y)) ** 2).sum(axis=1)
+        i = int(np.argmin(d2))
+        if d2[i] > radius ** 2:
+            return None
+
+        self.current_CP_i = i
+        return self.CP_list[i][:2]
 
     def NURBS_curve(self) -> None:
         """
-        samples and draws NURBS curve
+        samples and draws NURBS curve as a single line, moving the existing one if there is any
         """
-        labels = [label for _, _, label, _ in self.CP_list]
-        CPs = [(x, y) for x, y, _, _ in self.CP_list]
         weights = [w for _, _, _, w in self.CP_list]
 
-        print(", ".join(f"{labels[i]}: {CPs[i]}" for i in range(len(CPs))))
-        print(", ".join(f"w.{labels[i]}: {weights[i]}" for i in range(len(CPs))))
-
-        nurbs = NurbsCurve(CPs, weights, 3)
-        curve_points = nurbs.evaluate(samples=100)
+        # knots and basis only change with count(CPs), so dragging / reweighting reuses them
+        if self._nurbs is None:
+            self._nurbs = NurbsCurve(self._cp_xy, weights, 3)
+        else:
+            self._nurbs.set_control_points(self._cp_xy, weights)
+        # sample budget grows with count(CPs) instead of a fixed 100
+        samples = min(200, 8 * len(self.CP_list))
+        curve_points = self._nurbs.evaluate(samples=samples)
 
         # draw
-        for i in range(len(curve_points) - 1):
-            self.canvas.create_line(curve_points[i][0], curve_points[i][1],
-                                    curve_points[i + 1][0], curve_points[i + 1][1],
-                                    fill="orange", width=2)
+        flat = curve_points.ravel().tolist()
+        if self._curve_line_id is None:
+            self._curve_line_id = self.canvas.create_line(*flat, fill="orange", width=2, tags=("nurbs",))
+        else:
+            self.canvas.coords(self._curve_line_id, *flat)
+
+    def get_CP_oval_coords(self, x: int, y: int) -> Tuple[float, float, float, float]:
+        """
+        :param x: int of pixel row of the CP
+        :param y: int of pixel col of the CP
+        :return: bounding box (x0, y0, x1, y1) of the CP's vertice
+        """
+        return x - self.CP_size / 2, y - self.CP_size / 2, x + self.CP_size / 2, y + self.CP_size / 2
 
     def redraw_display(self) -> None:
         """
-        Clears and redraws the entire canvas
-        """
-        self.canvas.delete("all")
-
-        # lines btw CPs
-        if len(self.CP_list) > 1:
-            for i in range(len(self.CP_list)-1):
-                self.canvas.create_line(self.CP_list[i][0], self.CP_list[i][1],
-                                        self.CP_list[i+1][0], self.CP_list[i+1][1],
-                                        fill="lightseagreen", width=round(self.CP_size / 4, 0))
-        # CPs
-        for x, y, char, w in self.CP_list:
-            # vertice
-            self.canvas.create_oval(x - self.CP_size / 2, y - self.CP_size / 2,
-                                    x + self.CP_size / 2, y + self.CP_size / 2,
-                                    fill="lightseagreen", outline="lightseagreen")
-            # char label
-            self.canvas.create_text(x + self.CP_size, y, text=char, fill="lightseagreen", anchor="w", font=("Arial", 12))
-
-        # NURBS curve
+        Clears and redraws the Control Points, lines btw them and the curve
+        """
+        self.canvas.delete("cp_edge", "cp", "cp_label", "nurbs")
+        self._cp_oval_ids = []
+        self._cp_text_ids = []
+        self._cp_line_ids = []
+        self._curve_line_id = None
+
+        for i in range(len(self.CP_list)):
+            self.draw_CP(i)
+        self.redraw_NURBS_curve()
+
+    def draw_CP(self, i: int) -> None:
+        """
+        Draws Control Point i and the line from the previous CP, below all other items
+        :param i: int index of the CP in CP_list
+        """
+        x, y, char, _ = self.CP_list[i]
+
+        # line btw CPs
+        if i > 0:
+            self._cp_line_ids.append(
+                self.canvas.create_line(self.CP_list[i - 1][0], self.CP_list[i - 1][1], x, y,
+                                        fill="lightseagreen", width=round(self.CP_size / 4, 0), tags=("cp_edge",)))
+            self.canvas.tag_lower("cp_edge")
+        # vertice
+        self._cp_oval_ids.append(
+            self.canvas.create_oval(*self.get_CP_oval_coords(x, y), fill="lightseagreen", outline="lightseagreen",
+                                    tags=("cp",)))
+        # char label
+        self._cp_text_ids.append(
+            self.canvas.create_text(x + self.CP_size, y, text=char, fill="lightseagreen", anchor="w",
+                                    font=("Arial", 12), tags=("cp_label",)))
+
+    def redraw_NURBS_curve(self) -> None:
+        """
+        Redraws the curve for the current Control Points, removing it if there are too few
+        """
         if len(self.CP_list) > 3:
             self.NURBS_curve()
+        else:
+            self.canvas.delete("nurbs")
+            self._curve_line_id = None
+
+    def move_current_CP(self) -> None:
+        """
+        Moves the canvas items of the current Control Point, its adjacent lines and the curve
+        to their new coordinates instead of redrawing the entire canvas
+        """
+        i = self.current_CP_i
+        x, y, _, _ = self.CP_list[i]
+        self.canvas.coords(self._cp_oval_ids[i], *self.get_CP_oval_coords(x, y))
+        self.canvas.coords(self._cp_text_ids[i], x + self.CP_size, y)
+
+        # lines to previous and next CP
+        for j in (i - 1, i):
+            if 0 <= j < len(self._cp_line_ids):
+                self.canvas.coords(self._cp_line_ids[j], self.CP_list[j][0], self.CP_list[j][1],
+                                   self.CP_list[j + 1][0], self.CP_list[j + 1][1])
+
+        self.redraw_NURBS_curve()
+
+    def _schedule_redraw(self) -> None:
+        """
+        Queues a single update of the current Control Point and the curve for when Tk is idle,
+        so bursts of motion events collapse into one render
+        """
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        self._redraw_pending = False
+        self.move_current_CP()
 
     def show_weight_modifier(self) -> None:
         """
@@ -170,11 +247,12 @@ class Display:
 
         self.weight_slider_frame.pack(side=tk.BOTTOM, fill=tk.X)
 
-    def update_weight_from_slider(self, value: str) -> None:
+    def update_weight_from_slider(self, event) -> None:
         """
         Update the weight of the selected control point based on the slider's value
+        :param event: Bound to slider release
         """
-        new_weight = float(value)
+        new_weight = float(self.weight_slider.get())
         self.update_weight(new_weight)
 
     def update_weight(self, new_weight: float) -> None:
@@ -187,7 +265,8 @@ class Display:
             self.weight_var.set(new_weight)
             self.weight_slider.set(new_weight)
 
-            self.redraw_display()
+            # runs once per slider release and only the curve depends on w
+            self.redraw_NURBS_curve()
 
     # def show_knot_modifier(self) -> None:
     #     """
@@ -219,7 +298,10 @@ class Display:
 
     def clear_display(self) -> None:
         self.CP_list = []
+        self._next_label_ord = ord("A")
+        self._cp_xy = np.empty((0, 2))
         # self.knot_list = []
+        self._nurbs = None
         self.redraw_display()
 
 
@@ -1,5 +1,121 @@
 from typing import List, Tuple, Any
 import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _find_span(knots: np.ndarray, n: int, t: float) -> int:
+    """
+    Finds the knot span k where knot_{k} <= t < knot_{k+1}.
+    t at the end of the curve is clamped into the last non-empty span.
+    :param knots: float Array of the knot vector
+    :param n: int count of Control Points
+    :param t: t val on the curve
+    :return: int index of the knot span
+    """
+    return min(np.searchsorted(knots, t, side="right") - 1, n - 1)
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _basis_funs(knots: np.ndarray, degree: int, span: int, t: float,
+                N: np.ndarray, left: np.ndarray, right: np.ndarray) -> None:
+    """
+    Calculates the degree of influence of the Control Points at t on the curve.
+    Only N_{span-degree..span, degree} are non-zero, so the triangle of basis functions is built
+    iteratively from degree 0 up into N.
+    :param knots: float Array of the knot vector
+    :param degree: Curve degree
+    :param span: int index of the knot span containing t
+    :param t: t val on the curve
+    :param N: (degree + 1) Array receiving the non-zero basis function values
+    :param left: (degree + 1) scratch Array
+    :param right: (degree + 1) scratch Array
+    """
+    N[0] = 1.0
+    for j in range(1, degree + 1):
+        left[j] = t - knots[span + 1 - j]
+        right[j] = knots[span + j] - t
+        saved = 0.0
+        for r in range(j):
+            # N_{r,j-1} split between its two neighbours of degree j
+            # denominator = knot_{span+r+1} - knot_{span+r+1-j} >= knot_{span+1} - knot_{span} > 0,
+            # so unlike the recursive form no zero check (branch) is needed
+            temp = N[r] / (right[r + 1] + left[j - r])
+            N[r] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        N[j] = saved
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, parallel=True)
+def _basis_matrix(knots: np.ndarray, degree: int, t_values: np.ndarray, B: np.ndarray) -> None:
+    """
+    Scatters the non-zero basis functions of each t into its row of the dense basis matrix
+    :param knots: float Array of the knot vector
+    :param degree: Curve degree
+    :param t_values: float Array of t vals on the curve
+    :param B: zeroed (samples, count(CPs)) Array receiving each Control Point's influence at each t
+    """
+    # each t only writes its own row, so samples are split across threads
+    for s in prange(t_values.shape[0]):
+        N = np.empty(degree + 1)
+        left = np.empty(degree + 1)
+        right = np.empty(degree + 1)
+        t = t_values[s]
+        span = _find_span(knots, B.shape[1], t)
+        _basis_funs(knots, degree, span, t, N, left, right)
+        for j in range(degree + 1):
+            B[s, span - degree + j] = N[j]
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, parallel=True)
+def _basis_matrix_deg3(knots: np.ndarray, t_values: np.ndarray, B: np.ndarray) -> None:
+    """
+    _basis_matrix for degree 3 with the triangle of basis functions unrolled into straight-line code
+    :param knots: float Array of the knot vector
+    :param t_values: float Array of t vals on the curve
+    :param B: zeroed (samples, count(CPs)) Array receiving each Control Point's influence at each t
+    """
+    for s in prange(t_values.shape[0]):
+        t = t_values[s]
+        span = _find_span(knots, B.shape[1], t)
+        left1 = t - knots[span]
+        left2 = t - knots[span - 1]
+        left3 = t - knots[span - 2]
+        right1 = knots[span + 1] - t
+        right2 = knots[span + 2] - t
+        right3 = knots[span + 3] - t
+
+        # degree 1
+        temp = 1.0 / (right1 + left1)
+        N0 = right1 * temp
+        N1 = left1 * temp
+        # degree 2
+        temp = N0 / (right1 + left2)
+        N0 = right1 * temp
+        saved = left2 * temp
+        temp = N1 / (right2 + left1)
+        N1 = saved + right2 * temp
+        N2 = left1 * temp
+        # degree 3
+        temp = N0 / (right1 + left3)
+        N0 = right1 * temp
+        saved = left3 * temp
+        temp = N1 / (right2 + left2)
+        N1 = saved + right2 * temp
+        saved = left2 * temp
+        temp = N2 / (right3 + left1)
+        N2 = saved + right3 * temp
+        N3 = left1 * temp
+
+        B[s, span - 3] = N0
+        B[s, span - 2] = N1
+        B[s, span - 1] = N2
+        B[s, span] = N3
+
+
+# compile once at import instead of on the first redraw
+_basis_matrix(np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0]), 3, np.zeros(1), np.zeros((1, 4)))
+_basis_matrix_deg3(np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0]), np.zeros(1), np.zeros((1, 4)))
 
 
 class NurbsCurve:
@@ -9,75 +125,77 @@ class NurbsCurve:
         :param degree: Curve degree, defaults to 3
         :param weights: int List of weights  for Control Point magnitude
         """
-        self.control_points = control_points
         self.degree = degree
-        self.weights = weights if weights is not None else [1.0] * len(control_points)
+        # packed float64 arrays: (count(CPs), 2) and (count(CPs),), copied so callers' arrays aren't shared
+        self.CP = np.array(control_points, dtype=np.float64)
+        self.W = np.array(weights if weights is not None else [1.0] * len(self.CP), dtype=np.float64)
+        self.knots = self.get_uniform_knots_v()
+        self._basis_cache = {}  # samples: basis matrix
+
+    def set_control_points(self, control_points: List[Tuple[int]], weights: List[float]) -> None:
+        """
+        Updates the Control Points and weights in place. Knot vector and cached basis matrices
+        only depend on count(CPs), so they are rebuilt only when it changes.
+        :param control_points: List of (x, y) tuples for Control Points
+        :param weights: List of weights for Control Point magnitude
+        """
+        if len(control_points) == len(self.CP):
+            self.CP[:] = control_points
+            self.W[:] = weights
+            return
+
+        self.CP = np.array(control_points, dtype=np.float64)
+        self.W = np.array(weights, dtype=np.float64)
         self.knots = self.get_uniform_knots_v()
-        print(f"Knot V: {self.knots} / CPs: {len(control_points)}\n")
+        self._basis_cache.clear()
 
-    def get_uniform_knots_v(self) -> List[int]:
+    def get_uniform_knots_v(self) -> np.ndarray:
         """
         #knots = count(CPs) + degree + 1
-        [0, 0, 0, 0] + [1, ..., count(CPs) -2] + [count(CPs) - 2]*4
-        :return: int List[uniform knot vectors] from len(Control Points) and curve degree
+        [0] * (degree + 1) + [1, ..., count(CPs) - degree - 1] + [count(CPs) - degree] * (degree + 1)
+        :return: float Array[clamped uniform knot vector] from len(Control Points) and curve degree
         """
-        # num_knots = len(self.control_points) + self.degree + 1
-        # return [0] * (self.degree + 1) + list(range(1, len(self.control_points) - self.degree)) + [len(self.control_points) - self.degree] * (self.degree + 1)
-        num_knots = len(self.control_points) + self.degree + 1
-        return [0] * (self.degree + 1) + list(range(1, num_knots - 2 * self.degree)) + [num_knots - 2 * self.degree] * (self.degree + 1)
+        end = len(self.CP) - self.degree
+        knots = np.empty(len(self.CP) + self.degree + 1)
+        knots[:self.degree + 1] = 0.0
+        knots[self.degree + 1:-self.degree - 1] = np.arange(1, end)
+        knots[-self.degree - 1:] = end
+        return knots
 
-    def cox_de_boor(self, i: int, k: int, t: float) -> float:
+    def get_t_values(self, samples: int) -> np.ndarray:
         """
-        Calculate the degree of influence each weight has on each Control Point at t on the curve.
-        Sums up the weighted influence of all control points at each t by recursively calculating
-        along decreasing degree for points.
-        :param i: int index of the basis function along Control Points
-        :param k: degree of the basis function
-        :param t: t val (0 <= t <= 1)
-        :return: Basis function value at point
+        :param samples: How many points on the curve
+        :return: float Array of evenly spaced t values from current knot to last usable knot
         """
-        # k--
-        if k == 0:
-            # 1 if t ∈ [knot_{i}, knot_{i+1}]
-            return 1.0 if self.knots[i] <= t < self.knots[i + 1] else 0.0
-        else:
-            left_numerator = t - self.knots[i]
-            left_denominator = self.knots[i + k] - self.knots[i]
-            right_numerator = self.knots[i + k + 1] - t
-            right_denominator = self.knots[i + k + 1] - self.knots[i + 1]
+        t_min = self.knots[self.degree]  # current
+        t_max = self.knots[-self.degree - 1]  # last usable knot
+        return np.linspace(t_min, t_max, samples)
 
-            # (t - knot_i) / (knot_{i+k} - knot_i) * N_{i,k-1}(t)
-            left = (left_numerator / left_denominator * self.cox_de_boor(i, k - 1, t) if left_denominator != 0 else 0)
-            # (knot_{i+k+1} - t) / (knot_{i+k+1} - knot_{i+1}) * N_{i+1,k-1}(t)
-            right = (right_numerator / right_denominator * self.cox_de_boor(i + 1, k - 1, t) if right_denominator != 0 else 0)
+    def evaluate(self, samples: int = 100) -> np.ndarray:
+        """
+        Calculates the points along the curve.
+        Each Control Point's influence on each t value is cached, so moving or reweighting
+        Control Points only costs two matmuls
+        :param samples: How many points on the curve
+        :return: (samples, 2) Array of point coordinates (x, y) along the curve
+        """
+        if samples not in self._basis_cache:
+            self._basis_cache[samples] = self.basis_matrix(samples)
+        B = self._basis_cache[samples]
 
-            return left + right
+        # normalize points for all CPs influence
+        return (B @ (self.CP * self.W[:, None])) / (B @ self.W)[:, None]
 
-    def evaluate(self, samples: int = 100) -> List[Tuple[int]]:
+    def basis_matrix(self, samples: int = 100) -> np.ndarray:
         """
-        Calculates the points along the curve.
-        Generates t values, calcualtes each Control Point's influence on each t value
+        Influence of each Control Point on each t value. Depends only on count(CPs), degree and samples.
         :param samples: How many points on the curve
-        :return: List of point tuples (x, y) for coordinates along the curve
+        :return: (samples, count(CPs)) Array of basis function values
         """
-        curve_points = []
-        t_min = self.knots[self.degree]  # current
-        t_max = self.knots[-self.degree - 1]  # last usable knot
-        # evenly spaced t values from current knot to last usable knot
-        t_values = np.linspace(t_min, t_max, samples)
-
-        for t in t_values:
-            # placeholders
-            point = np.zeros(2)  # (x, y)
-            weight_sum = 0.0    # all CP's w*influence
-            for i in range(len(self.control_points)):
-                influence = self.cox_de_boor(i=i, k=self.degree, t=t)
-                weight_sum += influence * self.weights[i]
-                point += influence * self.weights[i] * np.array(self.control_points[i])
-
-            if weight_sum > 0:
-                # normalize point for all CPs influence
-                point /= weight_sum
-            curve_points.append(tuple(point))
-
-        return curve_points[:-1]
+        t_values = self.get_t_values(samples)
+        B = np.zeros((samples, len(self.CP)))
+        if self.degree == 3:
+            _basis_matrix_deg3(self.knots, t_values, B)
+        else:
+            _basis_matrix(self.knots, self.degree, t_values, B)
+        return B